@@ -1,8 +1,21 @@
+"""Vercel entrypoint: re-export the FastAPI app from main.py.
+
+The app is exposed as-is with no adapter (Mangum, WSGI shim, etc.) so the
+cold-start import graph is just main.py and its dependencies.
+"""
+
+import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path so we can import our main module
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path so we can import our main module. Appending
+# (instead of inserting at 0) keeps stdlib/site-packages lookups from
+# stat-ing the project root first. On Vercel the root is the Lambda task
+# root, which the runtime already exports, so no path needs resolving.
+_root = os.environ.get("LAMBDA_TASK_ROOT") or os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+if _root not in sys.path:
+    sys.path.append(_root)
 
 # Import the FastAPI app and export it directly
 # Vercel will automatically wrap it for serverless execution
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import csv
 import io
+import logging
 import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from docx import Document
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fpdf import FPDF
 from pydantic import BaseModel
-from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_metadata import YouTubeMetadata
 
+# requests, youtube_transcript_api, python-docx and fpdf2 are imported inside
+# the handlers that use them so a cold start only pays for FastAPI + stdlib.
+
 from transcript_utils import (
+    DEFAULT_FILENAME,
+    TTLCache,
     build_filtered_text,
     estimate_file_size_bytes,
     extract_video_id,
@@ -27,6 +38,8 @@ from transcript_utils import (
     sanitize_filename,
 )
 
+logger = logging.getLogger(__name__)
+
 BASE_DIR = Path(__file__).resolve().parent
 
 # Initialize FastAPI app
@@ -41,6 +54,8 @@ if not IS_VERCEL:
 
 # Setup Jinja2 templates
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Compile the page template during init so the first request doesn't pay for it
+templates.get_template("index.html")
 
 
 # Pydantic models for request/response
@@ -94,24 +109,141 @@ async def home(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.post("/api/fetch", response_model=FetchResponse)
-async def fetch_transcript(request: FetchRequest):
-    """Fetch video metadata and transcript."""
-    video_id = extract_video_id(request.url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Could not extract video ID from URL")
+# In-process caches for YouTube lookups, keyed by video_id (and language
+# code for segments). Re-fetching a video or switching back to a language
+# that was already loaded then skips the network entirely.
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+_METADATA_CACHE = TTLCache(maxsize=128, ttl=_CACHE_TTL_SECONDS)
+_TRANSCRIPT_OPTIONS_CACHE = TTLCache(maxsize=128, ttl=_CACHE_TTL_SECONDS)
+_SEGMENTS_CACHE = TTLCache(maxsize=64, ttl=_CACHE_TTL_SECONDS)
 
-    video_url = f"https://www.youtube.com/watch?v={video_id}"
 
-    # Fetch video metadata
+# Process-wide YouTube clients, built on first use. /api/fetch asks for them
+# from two worker threads at once, so creation is guarded by a lock.
+_CLIENTS_LOCK = threading.Lock()
+_http_session = None
+_metadata_session = None
+_transcript_api = None
+
+
+def _get_http_session():
+    """
+    Return the process-wide requests session used by the transcript client.
+
+    One pooled session keeps TLS connections warm across requests and
+    retries transient connection errors / 5xx responses with backoff.
+    """
+    global _http_session
+    if _http_session is None:
+        with _CLIENTS_LOCK:
+            if _http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util import Retry
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=10,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=(500, 502, 503, 504),
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+
+def _get_metadata_session():
+    """
+    Return the process-wide requests session for watch-page metadata scrapes.
+
+    Kept apart from the transcript client's session so the scrape never
+    inherits the headers that client sets on it, mounted without retries so
+    a lookup stays within its single 10s timeout, and with a cookie policy
+    that rejects everything so YouTube's cookies (YSC, VISITOR_INFO1_LIVE,
+    consent) never change the page later lookups get. Only the pooled
+    connections carry over between lookups.
+    """
+    global _metadata_session
+    if _metadata_session is None:
+        with _CLIENTS_LOCK:
+            if _metadata_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _metadata_session = session
+    return _metadata_session
+
+
+def _get_transcript_api():
+    """
+    Return the process-wide YouTubeTranscriptApi client.
+
+    Reusing one client keeps its HTTP session (connection pool, cookies)
+    warm across requests instead of paying a TLS handshake every fetch.
+    """
+    global _transcript_api
+    if _transcript_api is None:
+        # Resolve the session first: the lock is not reentrant
+        session = _get_http_session()
+        with _CLIENTS_LOCK:
+            if _transcript_api is None:
+                from youtube_transcript_api import YouTubeTranscriptApi
+
+                _transcript_api = YouTubeTranscriptApi(http_client=session)
+    return _transcript_api
+
+
+def _normalize_segments(fetched) -> list[dict]:
+    """Normalize a fetched transcript to list[dict] with text/start/duration keys."""
+    if hasattr(fetched, "to_raw_data"):
+        return fetched.to_raw_data()
+
+    # Snippets share one shape per library version, so probe it once.
+    snippets = list(fetched)
+    if snippets and hasattr(snippets[0], "to_dict"):
+        return [snippet.to_dict() for snippet in snippets]
+
+    return [
+        {
+            "text": snippet.text,
+            "start": float(snippet.start),
+            "duration": float(snippet.duration),
+        }
+        for snippet in snippets
+    ]
+
+
+def _fetch_video_metadata(
+    url: str, video_id: str
+) -> tuple[Optional[str], Optional[str], Optional[float], Optional[str]]:
+    """
+    Fetch (title, description, length, thumbnail_url) for a video.
+
+    Metadata is best-effort: failures are logged and yield None fields.
+    """
+    cached = _METADATA_CACHE.get(video_id)
+    if cached is not None:
+        return cached
+
     video_title = None
     video_description = None
     video_length = None
     thumbnail_url = None
 
     try:
-        print(f"[fetch_transcript] Fetching metadata for URL: {request.url}")
-        yt = YouTubeMetadata(request.url)
+        logger.debug("Fetching metadata for URL: %s", url)
+        # Pooled session so repeat lookups reuse a warm connection
+        yt = YouTubeMetadata(url, session=_get_metadata_session())
         video_title = yt.title
         video_description = yt.description
         video_length = yt.length or 0.0
@@ -119,80 +251,100 @@ async def fetch_transcript(request: FetchRequest):
             video_length = None
         thumbnail_url = yt.thumbnail_url
 
-        print(f"[fetch_transcript] Metadata fetched - Title: {video_title}, Length: {video_length}")
+        logger.debug("Metadata fetched - title: %s, length: %s", video_title, video_length)
 
         if video_title is None:
-            print(f"[fetch_transcript] WARNING: Title is None after YouTubeMetadata fetch")
-    except Exception as e:
-        print(f"[fetch_transcript] ERROR: Exception while fetching video info: {e}")
-        import traceback
-        traceback.print_exc()
+            logger.warning("Title is None after YouTubeMetadata fetch for %s", url)
+    except Exception:
+        logger.exception("Exception while fetching video info for %s", url)
 
-    # Fetch transcript options (languages) and default transcript
-    try:
-        api = YouTubeTranscriptApi()
-        transcript_list = api.list(video_id)
+    metadata = (video_title, video_description, video_length, thumbnail_url)
+    # Only cache real results so a transient scrape failure isn't remembered
+    if video_title is not None:
+        _METADATA_CACHE.set(video_id, metadata)
+    return metadata
 
-        # Build language options (deduplicated by language_code)
-        lang_options: dict[str, str] = {}
-        default_code: Optional[str] = None
 
-        for t in transcript_list:
-            code = t.language_code
-            label = t.language
+def _fetch_transcript_options(video_id: str) -> tuple[dict[str, str], str, list[dict]]:
+    """
+    Fetch (language options, default language code, default segments) for a video.
 
-            if t.is_generated:
-                label += " (auto-generated)"
+    Raises if the video has no usable transcript.
+    """
+    cached = _TRANSCRIPT_OPTIONS_CACHE.get(video_id)
+    if cached is not None:
+        lang_options, default_code = cached
+        segments = _SEGMENTS_CACHE.get((video_id, default_code))
+        if segments is not None:
+            return lang_options, default_code, segments
 
-            label_with_code = f"{label} [{code}]"
+    transcript_list = _get_transcript_api().list(video_id)
 
-            # Deduplicate by language_code
-            if code not in lang_options:
-                lang_options[code] = label_with_code
+    # Build language options (deduplicated by language_code) and rank each
+    # code for the default: exact English, then any English variant, then
+    # whatever YouTube listed first.
+    lang_options: dict[str, str] = {}
+    candidates: list[tuple[int, int, str]] = []
 
-            # First transcript as fallback default
-            if default_code is None:
-                default_code = code
-            # Prefer English if present
-            if code.startswith("en"):
-                default_code = code
+    for idx, t in enumerate(transcript_list):
+        code = t.language_code
+        if code in lang_options:
+            continue
 
-        if not lang_options:
-            raise RuntimeError("No transcripts available")
+        label = t.language
+        if t.is_generated:
+            label += " (auto-generated)"
+        lang_options[code] = f"{label} [{code}]"
 
-        # Choose default language code
-        if default_code is None:
-            default_code = next(iter(lang_options.keys()))
+        priority = 0 if code == "en" else 1 if code.startswith("en") else 2
+        candidates.append((priority, idx, code))
 
-        # Load the default transcript
-        transcript = transcript_list.find_transcript([default_code])
-        fetched = transcript.fetch()
+    if not lang_options:
+        raise RuntimeError("No transcripts available")
 
-        # Normalize to list[dict]
-        segments: list[dict] = []
-        if hasattr(fetched, "to_raw_data"):
-            segments = fetched.to_raw_data()
-        else:
-            for snippet in fetched:
-                if hasattr(snippet, "to_dict"):
-                    seg_dict = snippet.to_dict()
-                else:
-                    seg_dict = {
-                        "text": getattr(snippet, "text", ""),
-                        "start": float(getattr(snippet, "start", 0.0)),
-                        "duration": float(getattr(snippet, "duration", 0.0)),
-                    }
-                segments.append(seg_dict)
-
-        if not segments:
-            raise RuntimeError("Could not load default transcript")
+    default_code = min(candidates)[2]
 
-    except Exception as e:
-        print(f"[fetch_transcript] Error: {e}")
+    # Load the default transcript
+    transcript = transcript_list.find_transcript([default_code])
+    segments = _normalize_segments(transcript.fetch())
+    if not segments:
+        raise RuntimeError("Could not load default transcript")
+
+    _TRANSCRIPT_OPTIONS_CACHE.set(video_id, (lang_options, default_code))
+    _SEGMENTS_CACHE.set((video_id, default_code), segments)
+    return lang_options, default_code, segments
+
+
+@app.post("/api/fetch", response_model=FetchResponse)
+async def fetch_transcript(request: FetchRequest):
+    """Fetch video metadata and transcript."""
+    video_id = extract_video_id(request.url)
+    if not video_id:
+        raise HTTPException(status_code=400, detail="Could not extract video ID from URL")
+
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+
+    # Both lookups are blocking network calls with no dependency on each
+    # other, so run them concurrently in worker threads to keep the event
+    # loop free and pay for max(metadata, transcript) instead of the sum.
+    metadata, transcript_result = await asyncio.gather(
+        asyncio.to_thread(_fetch_video_metadata, request.url, video_id),
+        asyncio.to_thread(_fetch_transcript_options, video_id),
+        return_exceptions=True,
+    )
+
+    if isinstance(metadata, BaseException):
+        logger.error("Exception while fetching video info: %s", metadata)
+        metadata = (None, None, None, None)
+    video_title, video_description, video_length, thumbnail_url = metadata
+
+    if isinstance(transcript_result, BaseException):
+        logger.warning("Could not fetch transcript for %s: %s", video_id, transcript_result)
         raise HTTPException(
             status_code=400,
             detail="Error fetching transcript: the video has no accessible transcripts or is unavailable."
         )
+    lang_options, default_code, segments = transcript_result
 
     return FetchResponse(
         video_id=video_id,
@@ -207,35 +359,33 @@ async def fetch_transcript(request: FetchRequest):
     )
 
 
+def _fetch_segments(video_id: str, language_code: str) -> list[dict]:
+    """Fetch the normalized transcript segments for one language of a video."""
+    cache_key = (video_id, language_code)
+    segments = _SEGMENTS_CACHE.get(cache_key)
+    if segments is not None:
+        return segments
+
+    transcript_list = _get_transcript_api().list(video_id)
+    transcript = transcript_list.find_transcript([language_code])
+    segments = _normalize_segments(transcript.fetch())
+
+    _SEGMENTS_CACHE.set(cache_key, segments)
+    return segments
+
+
 @app.post("/api/load_transcript")
 async def load_transcript(video_id: str, language_code: str):
     """Load transcript for a specific language."""
     try:
-        api = YouTubeTranscriptApi()
-        transcript_list = api.list(video_id)
-        transcript = transcript_list.find_transcript([language_code])
-        fetched = transcript.fetch()
-
-        # Normalize to list[dict]
-        segments: list[dict] = []
-        if hasattr(fetched, "to_raw_data"):
-            segments = fetched.to_raw_data()
-        else:
-            for snippet in fetched:
-                if hasattr(snippet, "to_dict"):
-                    seg_dict = snippet.to_dict()
-                else:
-                    seg_dict = {
-                        "text": getattr(snippet, "text", ""),
-                        "start": float(getattr(snippet, "start", 0.0)),
-                        "duration": float(getattr(snippet, "duration", 0.0)),
-                    }
-                segments.append(seg_dict)
-
+        # Blocking network I/O; keep it off the event loop
+        segments = await asyncio.to_thread(_fetch_segments, video_id, language_code)
         return JSONResponse(content={"segments": segments})
 
     except Exception as e:
-        print(f"[load_transcript] Error: {e}")
+        logger.warning(
+            "Could not load transcript %s for %s: %s", language_code, video_id, e
+        )
         raise HTTPException(
             status_code=400,
             detail=f"Could not load transcript for language '{language_code}'"
@@ -342,6 +492,124 @@ async def apply_options(request: ApplyOptionsRequest):
     )
 
 
+# Dedicated pool for CPU-bound DOCX/PDF builds. Capping it keeps a burst of
+# exports from starving the default executor the fetch endpoints rely on.
+_EXPORT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+
+
+def _make_export_path(suffix: str) -> str:
+    """Create an empty temp file for an export and return its path."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    return path
+
+
+def _build_txt(text: str) -> bytes:
+    """Encode text as a UTF-8 TXT file."""
+    return text.encode("utf-8")
+
+
+def _build_csv(text: str) -> bytes:
+    """Encode text as a one-column CSV with a "text" header, one row per line."""
+    output = io.StringIO()
+    output.write("text\n")
+    writer = csv.writer(output, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    writer.writerows([line] for line in text.splitlines())
+    return output.getvalue().encode("utf-8")
+
+
+# A DOCX paragraph: a run of non-empty lines ending at a blank line
+_PARAGRAPH_RE = re.compile(r"[^\n]+(?:\n(?!\n)[^\n]+)*")
+
+
+def _build_docx(text: str) -> str:
+    """Write text to a temp DOCX, one paragraph per blank-line block; return its path."""
+    from docx import Document
+
+    doc = Document()
+    for match in _PARAGRAPH_RE.finditer(text):
+        doc.add_paragraph(match.group(0))
+    path = _make_export_path(".docx")
+    try:
+        doc.save(path)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def _build_pdf(text: str) -> str:
+    """Write text to a temp PDF using the built-in Helvetica font; return its path."""
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.set_margins(15, 15, 15)
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=11)
+
+    line_height = pdf.font_size * 1.5
+    effective_width = pdf.w - pdf.l_margin - pdf.r_margin
+
+    cleaned_text = text.replace("\r\n", "\n").replace("\r", "\n")
+    pdf.multi_cell(effective_width, line_height, cleaned_text)
+
+    path = _make_export_path(".pdf")
+    try:
+        pdf.output(path)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+class _TempFileResponse(FileResponse):
+    """
+    FileResponse for a temp export file that is always deleted afterwards.
+
+    A BackgroundTask only runs after a successful send, so a client that
+    disconnects mid-download would leave the file behind in /tmp.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            os.unlink(self.path)
+
+
+@dataclass(frozen=True)
+class _Exporter:
+    """
+    How to build one export format.
+
+    Exactly one builder is set. `build_bytes` (TXT/CSV) returns the file
+    bytes. `build_file` (DOCX/PDF) is CPU-bound, runs on the export pool,
+    and returns the path of a temp file that is streamed from disk and
+    deleted afterwards instead of being held in memory as a second full
+    copy.
+    """
+
+    media_type: str
+    build_bytes: Optional[Callable[[str], bytes]] = None
+    build_file: Optional[Callable[[str], str]] = None
+
+    def __post_init__(self) -> None:
+        if (self.build_bytes is None) == (self.build_file is None):
+            raise ValueError("Exactly one of build_bytes / build_file must be set")
+
+
+_EXPORTERS: dict[str, _Exporter] = {
+    "txt": _Exporter("text/plain", build_bytes=_build_txt),
+    "csv": _Exporter("text/csv", build_bytes=_build_csv),
+    "docx": _Exporter(
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        build_file=_build_docx,
+    ),
+    "pdf": _Exporter("application/pdf", build_file=_build_pdf),
+}
+
+
 @app.post("/api/export")
 async def export_file(request: ExportRequest):
     """Export transcript in the requested format."""
@@ -349,63 +617,30 @@ async def export_file(request: ExportRequest):
     if not text:
         raise HTTPException(status_code=400, detail="Nothing to export")
 
-    base_name = sanitize_filename(request.filename) if request.filename else "transcript"
-
-    if request.format == "txt":
-        data = text.encode("utf-8")
-        filename = base_name + ".txt"
-        media_type = "text/plain"
-
-    elif request.format == "csv":
-        lines = text.splitlines()
-        output = io.StringIO()
-        output.write("text\n")
-        for line in lines:
-            escaped = line.replace('"', '""')
-            output.write(f'"{escaped}"\n')
-        data = output.getvalue().encode("utf-8")
-        filename = base_name + ".csv"
-        media_type = "text/csv"
-
-    elif request.format == "docx":
-        doc = Document()
-        for paragraph in text.split("\n\n"):
-            doc.add_paragraph(paragraph)
-        buf = io.BytesIO()
-        doc.save(buf)
-        data = buf.getvalue()
-        filename = base_name + ".docx"
-        media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-
-    elif request.format == "pdf":
-        pdf = FPDF()
-        pdf.set_auto_page_break(auto=True, margin=15)
-        pdf.set_margins(15, 15, 15)
-        pdf.add_page()
-        pdf.set_font("Helvetica", size=11)
-
-        line_height = pdf.font_size * 1.5
-        effective_width = pdf.w - pdf.l_margin - pdf.r_margin
-
-        cleaned_text = text.replace("\r\n", "\n").replace("\r", "\n")
-        pdf.multi_cell(effective_width, line_height, cleaned_text)
-
-        raw_pdf = pdf.output()
-        if isinstance(raw_pdf, (bytes, bytearray)):
-            data = bytes(raw_pdf)
-        else:
-            data = str(raw_pdf).encode("latin-1")
-
-        filename = base_name + ".pdf"
-        media_type = "application/pdf"
+    base_name = sanitize_filename(request.filename) if request.filename else DEFAULT_FILENAME
 
-    else:
+    exporter = _EXPORTERS.get(request.format)
+    if exporter is None:
         raise HTTPException(status_code=400, detail="Unknown export type")
 
-    return StreamingResponse(
-        io.BytesIO(data),
-        media_type=media_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    filename = f"{base_name}.{request.format}"
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+
+    if exporter.build_file is not None:
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(_EXPORT_POOL, exporter.build_file, text)
+        # Stream the document from disk; the response deletes it when done
+        return _TempFileResponse(
+            path,
+            media_type=exporter.media_type,
+            headers=headers,
+        )
+
+    # TXT/CSV bytes are already in memory; send them as a single body
+    return Response(
+        content=exporter.build_bytes(text),
+        media_type=exporter.media_type,
+        headers=headers,
     )
 
 
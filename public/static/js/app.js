@@ -13,6 +13,8 @@ const state = {
     currentText: '',
     transcriptLanguages: {},
     currentLanguage: null,
+    // Segments already loaded for the current video, keyed by language code
+    segmentsByLanguage: {},
 };
 
 // DOM elements
@@ -43,14 +45,20 @@ const actionStatus = document.getElementById('action-status');
 // Utility Functions
 // ========================================
 
+let currentProgressPercent = 0;
+
 function setProgress(value) {
     const percent = Math.max(0, Math.min(100, value * 100));
+    if (percent === currentProgressPercent) return;
+    currentProgressPercent = percent;
     progressFill.style.width = `${percent}%`;
     progressLabel.textContent = `${Math.round(percent)}%`;
 }
 
-function resetProgress() {
-    setProgress(0);
+// Advance the fetch progress bar and its status message together
+function setFetchStep(value, message) {
+    setProgress(value);
+    fetchStatus.textContent = message;
 }
 
 function parseTimecode(s) {
@@ -87,11 +95,22 @@ function getVideoDuration() {
 
 function refreshCounts() {
     const text = state.currentText || '';
-    const words = text.split(/\s+/).filter(w => w.length > 0).length;
+    // One match pass instead of split() + filter(), which built two arrays
+    const words = (text.match(/\S+/g) || []).length;
     const chars = text.length;
     countsLabel.textContent = `Words: ${words} | Characters: ${chars} | Est. size: ${formatSize(chars)}`;
 }
 
+// Recounting rescans the whole transcript, so coalesce bursts of typing
+// in the preview into a single refresh once input goes idle
+const COUNTS_DEBOUNCE_MS = 150;
+let countsTimer = null;
+
+function scheduleRefreshCounts() {
+    clearTimeout(countsTimer);
+    countsTimer = setTimeout(refreshCounts, COUNTS_DEBOUNCE_MS);
+}
+
 function formatSize(bytes) {
     if (bytes < 1024) return `${bytes} B`;
     const kb = bytes / 1024;
@@ -100,12 +119,20 @@ function formatSize(bytes) {
     return `${mb.toFixed(2)} MB`;
 }
 
+function clearRangeError() {
+    // Skip the DOM write when there is no error showing (the common case
+    // when nudging times with the arrow buttons)
+    if (rangeError.textContent) {
+        rangeError.textContent = '';
+    }
+}
+
 function resetToFullRange() {
     const duration = getVideoDuration();
     if (!duration || duration <= 0) return;
     startInput.value = '0';
     endInput.value = formatTimestamp(duration);
-    rangeError.textContent = '';
+    clearRangeError();
 }
 
 // ========================================
@@ -159,7 +186,7 @@ function validateTimeRange() {
     // Update inputs with normalized values
     startInput.value = formatTimestamp(startSec);
     endInput.value = formatTimestamp(endSec);
-    rangeError.textContent = '';
+    clearRangeError();
     return true;
 }
 
@@ -173,7 +200,7 @@ function adjustTimeInput(inputElement, deltaSeconds) {
 
     const newSec = Math.max(0, Math.min(currentSec + deltaSeconds, duration));
     inputElement.value = formatTimestamp(newSec);
-    rangeError.textContent = '';
+    clearRangeError();
 }
 
 function adjustStart(delta) {
@@ -188,28 +215,41 @@ function adjustEnd(delta) {
 // Fetch Transcript
 // ========================================
 
+// In-flight /api/fetch request, aborted when a newer fetch starts so only
+// the latest video is shown
+let fetchController = null;
+
+// Serialized language map last rendered into the language selector
+let renderedLanguagesKey = null;
+
 async function fetchTranscript() {
-    resetProgress();
     actionStatus.textContent = '';
-    rangeError.textContent = '';
-    fetchStatus.textContent = 'Parsing URL...';
-    setProgress(0.1);
+    clearRangeError();
+    setFetchStep(0.1, 'Parsing URL...');
 
     const url = urlInput.value || '';
     if (!url) {
-        fetchStatus.textContent = 'Please enter a YouTube URL';
-        resetProgress();
+        setFetchStep(0, 'Please enter a YouTube URL');
         return;
     }
 
+    // Any pending fetch or language reload belongs to the previous video
+    if (fetchController) {
+        fetchController.abort();
+    }
+    abortLanguageLoad();
+
+    const controller = new AbortController();
+    fetchController = controller;
+
     try {
-        fetchStatus.textContent = 'Fetching transcript...';
-        setProgress(0.3);
+        setFetchStep(0.3, 'Fetching transcript...');
 
         const response = await fetch('/api/fetch', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ url }),
+            signal: controller.signal,
         });
 
         if (!response.ok) {
@@ -226,6 +266,9 @@ async function fetchTranscript() {
         state.videoLength = data.video_length;
         state.videoUrl = data.video_url;
         state.segments = data.segments;
+        state.segmentsByLanguage = { [data.default_language]: data.segments };
+        previewCache.clear();
+        exportCache.clear();
         state.transcriptLanguages = data.transcript_languages;
         state.currentLanguage = data.default_language;
 
@@ -240,20 +283,24 @@ async function fetchTranscript() {
             videoTitleLabel.href = '#';
         }
 
-        if (data.thumbnail_url) {
+        // Re-assigning the same src can trigger a reload; skip it on re-fetch
+        if (data.thumbnail_url && thumbnailImage.src !== data.thumbnail_url) {
             thumbnailImage.src = data.thumbnail_url;
-            thumbnailImage.onclick = () => window.open(state.videoUrl, '_blank');
         }
 
         videoInfoRow.style.display = 'flex';
 
-        // Populate language selector
-        transcriptLanguageSelect.innerHTML = '';
-        for (const [code, label] of Object.entries(data.transcript_languages)) {
-            const option = document.createElement('option');
-            option.value = code;
-            option.textContent = label;
-            transcriptLanguageSelect.appendChild(option);
+        // Populate language selector, rebuilding it only if the options differ
+        const languagesKey = JSON.stringify(data.transcript_languages);
+        if (languagesKey !== renderedLanguagesKey) {
+            const options = Object.entries(data.transcript_languages).map(([code, label]) => {
+                const option = document.createElement('option');
+                option.value = code;
+                option.textContent = label;
+                return option;
+            });
+            transcriptLanguageSelect.replaceChildren(...options);
+            renderedLanguagesKey = languagesKey;
         }
         transcriptLanguageSelect.value = data.default_language;
 
@@ -270,17 +317,20 @@ async function fetchTranscript() {
             endInput.value = '';
         }
 
-        setProgress(1.0);
-        fetchStatus.textContent = `Transcript fetched in ${data.default_language}.`;
+        setFetchStep(1.0, `Transcript fetched in ${data.default_language}.`);
 
         // Initialize preview
         updatePreview();
 
     } catch (error) {
+        if (error.name === 'AbortError') return; // Superseded by a newer fetch
         console.error('Fetch error:', error);
-        fetchStatus.textContent = error.message;
+        setFetchStep(0, error.message);
         videoInfoRow.style.display = 'none';
-        resetProgress();
+    } finally {
+        if (fetchController === controller) {
+            fetchController = null;
+        }
     }
 }
 
@@ -288,16 +338,45 @@ async function fetchTranscript() {
 // Apply Options
 // ========================================
 
+// In-flight /api/load_transcript request as { code, controller }. Repeated
+// Apply clicks for the same language wait on it; picking another language
+// aborts it so a stale transcript never lands.
+let languageLoad = null;
+
+function abortLanguageLoad() {
+    if (languageLoad) {
+        languageLoad.controller.abort();
+        languageLoad = null;
+    }
+}
+
 async function applyOptions() {
     const desiredCode = transcriptLanguageSelect.value;
 
+    if (languageLoad && languageLoad.code !== desiredCode) {
+        abortLanguageLoad();
+    }
+
     // If language changed, reload transcript
-    if (desiredCode && state.videoId && desiredCode !== state.currentLanguage) {
+    if (desiredCode && state.videoId && desiredCode !== state.currentLanguage &&
+        state.segmentsByLanguage[desiredCode]) {
+        // Switching back to a language loaded earlier needs no request
+        state.segments = state.segmentsByLanguage[desiredCode];
+        state.currentLanguage = desiredCode;
+        fetchStatus.textContent = `Transcript loaded in ${desiredCode}.`;
+    } else if (desiredCode && state.videoId && desiredCode !== state.currentLanguage) {
+        // Already loading this language; it refreshes the preview when done
+        if (languageLoad) return;
+
         fetchStatus.textContent = `Reloading transcript in ${desiredCode}...`;
 
+        const load = { code: desiredCode, controller: new AbortController() };
+        languageLoad = load;
+
         try {
             const response = await fetch(`/api/load_transcript?video_id=${state.videoId}&language_code=${desiredCode}`, {
                 method: 'POST',
+                signal: load.controller.signal,
             });
 
             if (!response.ok) {
@@ -307,13 +386,19 @@ async function applyOptions() {
 
             const data = await response.json();
             state.segments = data.segments;
+            state.segmentsByLanguage[desiredCode] = data.segments;
             state.currentLanguage = desiredCode;
             fetchStatus.textContent = `Transcript loaded in ${desiredCode}.`;
 
         } catch (error) {
+            if (error.name === 'AbortError') return; // Superseded
             console.error('Load transcript error:', error);
             fetchStatus.textContent = error.message;
             return;
+        } finally {
+            if (languageLoad === load) {
+                languageLoad = null;
+            }
         }
     }
 
@@ -325,7 +410,51 @@ async function applyOptions() {
 // Update Preview
 // ========================================
 
+// Recently built previews for the loaded video, keyed on the options that
+// produced them, so toggling back to an earlier combination skips the
+// round-trip. Cleared whenever a new video is fetched.
+const PREVIEW_CACHE_SIZE = 8;
+const previewCache = new Map();
+
+function previewCacheKey() {
+    return JSON.stringify([
+        state.currentLanguage,
+        startInput.value,
+        endInput.value,
+        displayMode.value,
+        includeTitleCheckbox.checked,
+        includeDescriptionCheckbox.checked,
+    ]);
+}
+
+function cachePreview(key, data) {
+    previewCache.set(key, data);
+    if (previewCache.size > PREVIEW_CACHE_SIZE) {
+        // Maps iterate in insertion order, so the first key is the oldest
+        previewCache.delete(previewCache.keys().next().value);
+    }
+}
+
+function renderPreview(data) {
+    state.currentText = data.text;
+    // Reassigning an identical value still re-lays out the whole textarea
+    // and resets its scroll position, so only write real changes
+    if (previewArea.value !== data.text) {
+        previewArea.value = data.text;
+    }
+    countsLabel.textContent = `Words: ${data.word_count} | Characters: ${data.char_count} | Est. size: ${data.size_str}`;
+}
+
+// In-flight /api/apply_options request, aborted when a newer preview starts
+// so rapid Apply clicks only render (and wait for) the latest options
+let previewController = null;
+
 async function updatePreview() {
+    if (previewController) {
+        previewController.abort();
+        previewController = null;
+    }
+
     if (!state.segments || state.segments.length === 0) {
         state.currentText = '';
         previewArea.value = '';
@@ -338,9 +467,20 @@ async function updatePreview() {
         return; // Error message already set by validateTimeRange()
     }
 
+    const cacheKey = previewCacheKey();
+    const cached = previewCache.get(cacheKey);
+    if (cached) {
+        renderPreview(cached);
+        return;
+    }
+
+    const controller = new AbortController();
+    previewController = controller;
+
     try {
         const response = await fetch('/api/apply_options', {
             method: 'POST',
+            signal: controller.signal,
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
                 video_id: state.videoId,
@@ -363,13 +503,17 @@ async function updatePreview() {
         }
 
         const data = await response.json();
-        state.currentText = data.text;
-        previewArea.value = data.text;
-        countsLabel.textContent = `Words: ${data.word_count} | Characters: ${data.char_count} | Est. size: ${data.size_str}`;
+        cachePreview(cacheKey, data);
+        renderPreview(data);
 
     } catch (error) {
+        if (error.name === 'AbortError') return; // Superseded by a newer preview
         console.error('Apply options error:', error);
         rangeError.textContent = error.message;
+    } finally {
+        if (previewController === controller) {
+            previewController = null;
+        }
     }
 }
 
@@ -415,6 +559,12 @@ function fallbackCopy(text) {
 // Export File
 // ========================================
 
+// Last exported file per format. Exporting the same text under the same
+// name again (e.g. re-downloading after a dismissed save dialog) reuses it
+// instead of rebuilding the document on the server. Cleared whenever a new
+// video is fetched so old documents aren't kept in memory.
+const exportCache = new Map();
+
 async function exportFile(format) {
     const text = previewArea.value || state.currentText || '';
     if (!text) {
@@ -427,23 +577,33 @@ async function exportFile(format) {
                      (state.videoTitle ? sanitizeFilename(state.videoTitle) : 'transcript');
 
     try {
-        const response = await fetch('/api/export', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ text, filename, format }),
-        });
+        let exported = exportCache.get(format);
+        if (!exported || exported.text !== text || exported.filename !== filename) {
+            const response = await fetch('/api/export', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ text, filename, format }),
+            });
 
-        if (!response.ok) {
-            const error = await response.json();
-            throw new Error(error.detail || 'Export failed');
+            if (!response.ok) {
+                const error = await response.json();
+                throw new Error(error.detail || 'Export failed');
+            }
+
+            exported = {
+                text,
+                filename,
+                blob: await response.blob(),
+                downloadName: response.headers.get('Content-Disposition')?.split('filename=')[1] || `${filename}.${format}`,
+            };
+            exportCache.set(format, exported);
         }
 
         // Download file
-        const blob = await response.blob();
-        const url = window.URL.createObjectURL(blob);
+        const url = window.URL.createObjectURL(exported.blob);
         const a = document.createElement('a');
         a.href = url;
-        a.download = response.headers.get('Content-Disposition')?.split('filename=')[1] || `${filename}.${format}`;
+        a.download = exported.downloadName;
         document.body.appendChild(a);
         a.click();
         window.URL.revokeObjectURL(url);
@@ -461,6 +621,12 @@ async function exportFile(format) {
 // Helper Functions
 // ========================================
 
+function openVideo() {
+    if (state.videoUrl) {
+        window.open(state.videoUrl, '_blank');
+    }
+}
+
 function sanitizeFilename(name) {
     return name.replace(/[\\/:*?"<>|]/g, '').replace(/\s+/g, '_').replace(/^_+|_+$/g, '') || 'transcript';
 }
@@ -472,6 +638,7 @@ function sanitizeFilename(name) {
 fetchButton.addEventListener('click', fetchTranscript);
 applyButton.addEventListener('click', applyOptions);
 copyButton.addEventListener('click', copyToClipboard);
+thumbnailImage.addEventListener('click', openVideo);
 
 // Time input blur handlers
 startInput.addEventListener('blur', () => {
@@ -485,7 +652,7 @@ startInput.addEventListener('blur', () => {
         resetToFullRange();
     } else if (sVal === '') {
         startInput.value = '0';
-        rangeError.textContent = '';
+        clearRangeError();
     }
 });
 
@@ -509,5 +676,5 @@ urlInput.addEventListener('keypress', (e) => {
 // Update counts when user edits preview
 previewArea.addEventListener('input', () => {
     state.currentText = previewArea.value;
-    refreshCounts();
+    scheduleRefreshCounts();
 });
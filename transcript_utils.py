@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Any, Hashable, List, Dict, Optional
 from urllib.parse import urlparse, parse_qs
 
-import re
+import threading
+import time
+
+
+# Base name used when no usable export filename is available
+DEFAULT_FILENAME = "transcript"
+
+# Translation table that deletes characters illegal in filenames
+_ILLEGAL_FILENAME_CHARS_TABLE = str.maketrans("", "", '\\/:*?"<>|')
 
 
 # ---------- Data model ----------
@@ -38,9 +48,46 @@ class AppState:
     is_fetching: bool = False
 
 
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    Used for YouTube lookups, which are slow and rarely change. Keep it per
+    process: a warm serverless instance reuses it, a cold one starts empty.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
 # ---------- URL & time utilities ----------
 
 
+@lru_cache(maxsize=256)
 def extract_video_id(url: str) -> Optional[str]:
     """Extract YouTube video ID from typical URL formats."""
     try:
@@ -83,7 +130,12 @@ def parse_timecode(s: Optional[str]) -> Optional[float]:
 
 def format_timestamp(seconds: float) -> str:
     """Format seconds as hh:mm:ss or mm:ss."""
-    total = int(round(seconds))
+    return _format_whole_seconds(int(round(seconds)))
+
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(total: int) -> str:
+    """Cached formatter keyed on whole seconds, shared by every transcript render."""
     h = total // 3600
     m = (total % 3600) // 60
     s = total % 60
@@ -124,6 +176,24 @@ def format_size(bytes_count: int) -> str:
 # ---------- transcript formatting ----------
 
 
+def _bisect_segment_starts(segments: List[Dict], seconds: float, inclusive: bool) -> int:
+    """
+    Binary search over segment start times.
+
+    Returns the index of the first segment whose start is >= seconds, or
+    > seconds when inclusive is True (bisect_left / bisect_right semantics).
+    """
+    lo, hi = 0, len(segments)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = segments[mid]["start"]
+        if start < seconds or (inclusive and start == seconds):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
 def build_filtered_text(
     segments: List[Dict],
     start_str: str,
@@ -153,21 +223,19 @@ def build_filtered_text(
     idx_start = 0
     idx_end = len(segments) - 1
 
+    # Segments are ordered by start time, so both bounds are binary searches
+
     # "closest previous timestamp" logic for start
     if start_sec is not None:
-        for i, seg in enumerate(segments):
-            if seg["start"] >= start_sec:
-                idx_start = max(0, i - 1)
-                break
+        i = _bisect_segment_starts(segments, start_sec, inclusive=False)
+        if i < len(segments):
+            idx_start = max(0, i - 1)
         else:
             idx_start = max(0, len(segments) - 2)
 
     # "closest next timestamp" logic for end
     if end_sec is not None:
-        last_idx = 0
-        for i, seg in enumerate(segments):
-            if seg["start"] <= end_sec:
-                last_idx = i
+        last_idx = max(0, _bisect_segment_starts(segments, end_sec, inclusive=True) - 1)
         idx_end = min(len(segments) - 1, last_idx + 1)
 
     filtered = segments[idx_start : idx_end + 1]
@@ -215,12 +283,12 @@ def sanitize_filename(name: str) -> str:
     Also collapse spaces to underscores.
     """
     # Strip illegal characters
-    name = re.sub(r'[\\/:*?"<>|]', "", name)
+    name = name.translate(_ILLEGAL_FILENAME_CHARS_TABLE)
 
     # Replace whitespace runs with "_"
-    name = re.sub(r"\s+", "_", name)
+    name = "_".join(name.split())
 
     # Remove leading/trailing underscores
     name = name.strip("_")
 
-    return name or "transcript"
+    return name or DEFAULT_FILENAME
@@ -2,18 +2,35 @@
 
 import re
 import json
+import logging
 import ssl
 from typing import Optional
 import urllib.request
 import urllib.parse
 import certifi
 
+logger = logging.getLogger(__name__)
+
+# Video ID patterns, tried in order
+_VIDEO_ID_PATTERNS = [
+    re.compile(r'(?:v=|\/)([0-9A-Za-z_-]{11}).*'),
+    re.compile(r'(?:embed\/)([0-9A-Za-z_-]{11})'),
+    re.compile(r'^([0-9A-Za-z_-]{11})$'),
+]
+
 
 class YouTubeMetadata:
     """Lightweight YouTube video metadata fetcher."""
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, session=None):
+        """
+        Fetch metadata for ``url``.
+
+        ``session`` is an optional requests.Session to reuse pooled
+        connections; without one a plain urllib request is made.
+        """
         self.url = url
+        self._session = session
         self._title: Optional[str] = None
         self._description: Optional[str] = None
         self._length: Optional[float] = None
@@ -33,13 +50,18 @@ class YouTubeMetadata:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            req = urllib.request.Request(watch_url, headers=headers)
+            if self._session is not None:
+                response = self._session.get(watch_url, headers=headers, timeout=10)
+                response.raise_for_status()
+                html = response.content.decode('utf-8')
+            else:
+                req = urllib.request.Request(watch_url, headers=headers)
 
-            # Create SSL context with certifi's CA bundle for proper certificate verification
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
+                # Create SSL context with certifi's CA bundle for proper certificate verification
+                ssl_context = ssl.create_default_context(cafile=certifi.where())
 
-            with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
-                html = response.read().decode('utf-8')
+                with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
+                    html = response.read().decode('utf-8')
 
             # Extract metadata from ytInitialPlayerResponse JSON
             match = re.search(r'var ytInitialPlayerResponse\s*=\s*({.+?});', html)
@@ -58,7 +80,7 @@ class YouTubeMetadata:
                 self._thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg"
 
         except Exception as e:
-            print(f"[YouTubeMetadata] Error fetching metadata: {e}")
+            logger.warning("Error fetching metadata for %s: %s", self.url, e)
             # Fallback to basic thumbnail if everything else fails
             video_id = self._extract_video_id(self.url)
             if video_id:
@@ -67,14 +89,8 @@ class YouTubeMetadata:
     @staticmethod
     def _extract_video_id(url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        patterns = [
-            r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed\/)([0-9A-Za-z_-]{11})',
-            r'^([0-9A-Za-z_-]{11})$'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _VIDEO_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None